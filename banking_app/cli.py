@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import argparse
-import json
-from datetime import datetime
-from typing import Iterable, Optional
+import sys
+from typing import TYPE_CHECKING, List, Optional, Sequence
 
-from .models import Institution
-from .services import BankingManager, default_data_path
-from .storage import BankingDataStore
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    from datetime import datetime
+
+
+_PARSER: Optional[argparse.ArgumentParser] = None
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -117,18 +118,37 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def _resolve_storage(path: Optional[str]) -> str:
-    return path or default_data_path()
+    if path:
+        return path
+    from .services import default_data_path
+
+    return default_data_path()
 
 
 def _format_date(raw: Optional[str]) -> Optional[datetime]:
     if not raw:
         return None
+    from datetime import datetime
+
     return datetime.fromisoformat(raw)
 
 
-def main(argv: Optional[Iterable[str]] = None) -> None:
-    parser = build_parser()
-    args = parser.parse_args(list(argv) if argv is not None else None)
+def _write_lines(lines: List[str]) -> None:
+    """Write ``lines`` to stdout in a single call."""
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    parser = _PARSER
+    args = parser.parse_args(argv)
+
+    # Imported after argument parsing so ``--help`` and usage errors stay fast.
+    from .services import BankingManager
+    from .storage import BankingDataStore
 
     storage_path = _resolve_storage(args.storage)
     store = BankingDataStore(storage_path)
@@ -140,6 +160,8 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
         return
 
     if args.command == "add-institution":
+        from .models import Institution
+
         institution = Institution(
             name=args.name,
             website=args.website,
@@ -155,14 +177,18 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
         if not institutions:
             print("No institutions stored.")
             return
+        lines = []
+        append = lines.append
         for inst in institutions:
             description = inst.name
-            extras = [value for value in [inst.website, inst.support_phone] if value]
+            extras = [value for value in (inst.website, inst.support_phone) if value]
             if extras:
                 description += f" ({', '.join(extras)})"
-            if inst.notes:
-                description += f"\n  Notes: {inst.notes}"
-            print(f"- {description}")
+            notes = inst.notes
+            if notes:
+                description += f"\n  Notes: {notes}"
+            append(f"- {description}")
+        _write_lines(lines)
         return
 
     if args.command == "add-card":
@@ -186,22 +212,28 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
         if not cards:
             print("No cards stored.")
             return
+        lines = []
+        append = lines.append
+        header = "- {} [{}] from {}\n  Limit: {:.2f} Balance: {:.2f}".format
         for card in cards:
-            description = (
-                f"- {card.name} [{card.card_type}] from {card.institution}\n"
-                f"  Limit: {card.credit_limit:.2f} Balance: {card.balance:.2f}"
+            description = header(
+                card.name, card.card_type, card.institution, card.credit_limit, card.balance
             )
-            if card.interest_rate is not None:
-                description += f" APR: {card.interest_rate:.2f}%"
-            if card.annual_fee is not None:
-                description += f" Annual fee: {card.annual_fee:.2f}"
-            if card.rewards:
-                description += f"\n  Rewards: {card.rewards}"
-            if card.tags:
-                description += f"\n  Tags: {', '.join(card.tags)}"
-            if card.notes:
-                description += f"\n  Notes: {card.notes}"
-            print(description)
+            interest_rate = card.interest_rate
+            if interest_rate is not None:
+                description += f" APR: {interest_rate:.2f}%"
+            annual_fee = card.annual_fee
+            if annual_fee is not None:
+                description += f" Annual fee: {annual_fee:.2f}"
+            rewards, tags, notes = card.rewards, card.tags, card.notes
+            if rewards:
+                description += f"\n  Rewards: {rewards}"
+            if tags:
+                description += f"\n  Tags: {', '.join(tags)}"
+            if notes:
+                description += f"\n  Notes: {notes}"
+            append(description)
+        _write_lines(lines)
         return
 
     if args.command == "update-credit-score":
@@ -224,18 +256,30 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
         if not scores:
             print("No credit scores stored.")
             return
+        lines = []
+        append = lines.append
         for score in scores:
             description = (
                 f"- {score.provider}: {score.score} (updated {score.last_updated.date()})"
             )
-            if score.notes:
-                description += f"\n  Notes: {score.notes}"
-            print(description)
+            notes = score.notes
+            if notes:
+                description += f"\n  Notes: {notes}"
+            append(description)
+        _write_lines(lines)
         return
 
     if args.command == "summary":
-        summary = manager.summary()
-        print(json.dumps(summary, indent=2))
+        from .storage import dumps_json
+
+        payload = dumps_json(manager.summary()) + b"\n"
+        sys.stdout.flush()
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is not None:
+            buffer.write(payload)
+            buffer.flush()
+        else:
+            sys.stdout.write(payload.decode("utf-8"))
         return
 
     parser.print_help()
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _parse_timestamp(raw: str) -> datetime:
+    """Parse an ISO timestamp, reusing results for strings seen before.
+
+    The same stored timestamps are parsed on every load, and ``datetime``
+    instances are immutable, so sharing them is safe. The cache is unbounded:
+    a bounded LRU would evict every entry during a sequential scan of a
+    store with more timestamps than its size, and the key set is already
+    bounded by the stored data.
+    """
+
+    return datetime.fromisoformat(raw)
+
+
+@dataclass(slots=True)
 class Institution:
     """Represents a banking institution that issues payment cards."""
 
@@ -19,7 +34,12 @@ class Institution:
     def to_dict(self) -> Dict[str, Optional[str]]:
         """Return a serialisable representation of the institution."""
 
-        return asdict(self)
+        return {
+            "name": self.name,
+            "website": self.website,
+            "support_phone": self.support_phone,
+            "notes": self.notes,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Optional[str]]) -> "Institution":
@@ -33,7 +53,7 @@ class Institution:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Card:
     """Represents a payment card that belongs to a user."""
 
@@ -52,9 +72,19 @@ class Card:
     def to_dict(self) -> Dict[str, object]:
         """Return a serialisable representation of the card."""
 
-        data = asdict(self)
-        data["tags"] = list(self.tags)
-        return data
+        return {
+            "id": self.id,
+            "institution": self.institution,
+            "name": self.name,
+            "card_type": self.card_type,
+            "credit_limit": self.credit_limit,
+            "balance": self.balance,
+            "interest_rate": self.interest_rate,
+            "annual_fee": self.annual_fee,
+            "rewards": self.rewards,
+            "notes": self.notes,
+            "tags": list(self.tags),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "Card":
@@ -83,7 +113,7 @@ class Card:
         return max(0.0, min(1.0, self.balance / self.credit_limit))
 
 
-@dataclass
+@dataclass(slots=True)
 class CreditScore:
     """Represents a credit score provided by a scoring bureau."""
 
@@ -111,7 +141,7 @@ class CreditScore:
         if isinstance(last_updated_raw, datetime):
             last_updated = last_updated_raw
         elif last_updated_raw:
-            last_updated = datetime.fromisoformat(str(last_updated_raw))
+            last_updated = _parse_timestamp(str(last_updated_raw))
         else:
             last_updated = datetime.now(UTC)
         return cls(
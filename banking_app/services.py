@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+import math
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
-from statistics import mean
-from typing import Dict, Iterable, List, Optional
-from uuid import uuid4
+from typing import Any, Dict, Iterable, List, Optional
 
 from .models import Card, CreditScore, Institution
 from .storage import BankingDataStore
 
+# Stored integers must fit in 64 bits, the range the JSON encoders support.
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
 
 class BankingManager:
-    """High level API for working with the banking data store."""
+    """High level API for working with the banking data store.
+
+    Data returned by :meth:`BankingDataStore.load` is shared with the store's
+    cache, so mutating methods copy the containers they change rather than
+    editing them in place.
+    """
 
     def __init__(self, store: BankingDataStore) -> None:
         self.store = store
@@ -23,15 +32,16 @@ class BankingManager:
     # ------------------------------------------------------------------
     def list_institutions(self) -> List[Institution]:
         data = self.store.load()
-        return [Institution.from_dict(raw) for raw in data.get("institutions", [])]
+        return [Institution.from_dict(raw) for raw in data["institutions"].values()]
 
     def add_institution(self, institution: Institution) -> Institution:
         data = self.store.load()
-        existing = [inst for inst in data.get("institutions", []) if inst["name"].lower() == institution.name.lower()]
-        if existing:
+        key = institution.name.lower()
+        if key in data["institutions"]:
             raise ValueError(f"Institution '{institution.name}' already exists")
-        data.setdefault("institutions", []).append(institution.to_dict())
-        self.store.save(data)
+        institutions = dict(data["institutions"])
+        institutions[key] = institution.to_dict()
+        self.store.save({**data, "institutions": institutions})
         return institution
 
     # ------------------------------------------------------------------
@@ -39,10 +49,11 @@ class BankingManager:
     # ------------------------------------------------------------------
     def list_cards(self, institution_name: Optional[str] = None) -> List[Card]:
         data = self.store.load()
-        cards = [Card.from_dict(raw) for raw in data.get("cards", [])]
-        if institution_name:
-            cards = [card for card in cards if card.institution.lower() == institution_name.lower()]
-        return cards
+        cards = data["cards"]
+        if not institution_name:
+            return [Card.from_dict(raw) for raw in cards.values()]
+        card_ids = data["cards_by_institution"].get(institution_name.lower(), ())
+        return [Card.from_dict(cards[card_id]) for card_id in card_ids]
 
     def add_card(
         self,
@@ -58,9 +69,21 @@ class BankingManager:
         notes: Optional[str] = None,
         tags: Optional[Iterable[str]] = None,
     ) -> Card:
+        from uuid import uuid4
+
+        amounts = {
+            "credit_limit": credit_limit,
+            "balance": balance,
+            "interest_rate": interest_rate,
+            "annual_fee": annual_fee,
+        }
+        for field_name, value in amounts.items():
+            if value is not None and not math.isfinite(value):
+                raise ValueError(f"Card {field_name} must be a finite number, got {value}")
+
         data = self.store.load()
-        institutions = data.get("institutions", [])
-        if not any(inst["name"].lower() == institution_name.lower() for inst in institutions):
+        key = institution_name.lower()
+        if key not in data["institutions"]:
             raise ValueError(
                 f"Institution '{institution_name}' does not exist. "
                 "Create it before adding cards."
@@ -79,8 +102,11 @@ class BankingManager:
             notes=notes,
             tags=list(tags or []),
         )
-        data.setdefault("cards", []).append(card.to_dict())
-        self.store.save(data)
+        cards = dict(data["cards"])
+        cards[card.id] = card.to_dict()
+        by_institution = dict(data["cards_by_institution"])
+        by_institution[key] = [*by_institution.get(key, ()), card.id]
+        self.store.save({**data, "cards": cards, "cards_by_institution": by_institution})
         return card
 
     # ------------------------------------------------------------------
@@ -88,7 +114,7 @@ class BankingManager:
     # ------------------------------------------------------------------
     def list_credit_scores(self) -> List[CreditScore]:
         data = self.store.load()
-        return [CreditScore.from_dict(raw) for raw in data.get("credit_scores", [])]
+        return [CreditScore.from_dict(raw) for raw in data["credit_scores"].values()]
 
     def update_credit_score(
         self,
@@ -98,50 +124,75 @@ class BankingManager:
         last_updated: Optional[datetime] = None,
         notes: Optional[str] = None,
     ) -> CreditScore:
+        if not _INT64_MIN <= int(score) <= _INT64_MAX:
+            raise ValueError(f"Credit score {score} is out of range")
+
         data = self.store.load()
-        credit_scores = data.setdefault("credit_scores", [])
-        existing_idx = next((i for i, raw in enumerate(credit_scores) if raw["provider"].lower() == provider.lower()), None)
         score_obj = CreditScore(
             provider=provider,
             score=int(score),
             last_updated=last_updated or datetime.now(UTC),
             notes=notes,
         )
-        if existing_idx is not None:
-            credit_scores[existing_idx] = score_obj.to_dict()
-        else:
-            credit_scores.append(score_obj.to_dict())
-        self.store.save(data)
+        credit_scores = dict(data["credit_scores"])
+        credit_scores[provider.lower()] = score_obj.to_dict()
+        self.store.save({**data, "credit_scores": credit_scores})
         return score_obj
 
     # ------------------------------------------------------------------
     # High level summaries
     # ------------------------------------------------------------------
     def credit_utilisation(self) -> float:
-        cards = self.list_cards()
-        limits = [card.credit_limit for card in cards if card.credit_limit > 0]
-        balances = [card.balance for card in cards]
-        if not limits:
+        return self._credit_utilisation(self.store.load()["cards"].values())
+
+    @staticmethod
+    def _credit_utilisation(cards: Iterable[Dict[str, Any]]) -> float:
+        """Return the overall utilisation for raw card dicts in a single pass."""
+
+        total_limit = 0.0
+        total_balance = 0.0
+        for raw in cards:
+            limit = float(raw.get("credit_limit", 0.0))
+            if limit > 0:
+                total_limit += limit
+            total_balance += float(raw.get("balance", 0.0))
+        if not total_limit:
             return 0.0
-        total_limit = sum(limits)
-        total_balance = sum(balances)
         return min(1.0, max(0.0, total_balance / total_limit))
 
     def summary(self) -> Dict[str, object]:
         data = self.store.load()
-        institutions = [Institution.from_dict(raw) for raw in data.get("institutions", [])]
-        cards = [Card.from_dict(raw) for raw in data.get("cards", [])]
-        credit_scores = [CreditScore.from_dict(raw) for raw in data.get("credit_scores", [])]
+        cards = data["cards"].values()
+        # The stored credit score dicts are already in their serialised form;
+        # shallow copies keep callers from mutating the store's cache.
+        credit_scores = [dict(raw) for raw in data["credit_scores"].values()]
+        utilisation = self._credit_utilisation(cards)
+
+        highest: Optional[int] = None
+        lowest: Optional[int] = None
+        average: Optional[float] = None
+        if credit_scores:
+            total_score = 0
+            for raw in credit_scores:
+                value = int(raw.get("score", 0))
+                total_score += value
+                if highest is None or value > highest:
+                    highest = value
+                if lowest is None or value < lowest:
+                    lowest = value
+            count = len(credit_scores)
+            # Match statistics.mean: whole averages stay ints.
+            quotient, remainder = divmod(total_score, count)
+            average = quotient if not remainder else total_score / count
 
-        score_values = [score.score for score in credit_scores]
         summary_data: Dict[str, object] = {
-            "total_institutions": len(institutions),
+            "total_institutions": len(data["institutions"]),
             "total_cards": len(cards),
-            "credit_utilisation": self.credit_utilisation(),
-            "credit_scores": [score.to_dict() for score in credit_scores],
-            "highest_credit_score": max(score_values) if score_values else None,
-            "lowest_credit_score": min(score_values) if score_values else None,
-            "average_credit_score": mean(score_values) if score_values else None,
+            "credit_utilisation": utilisation,
+            "credit_scores": credit_scores,
+            "highest_credit_score": highest,
+            "lowest_credit_score": lowest,
+            "average_credit_score": average,
         }
         return summary_data
 
@@ -151,9 +202,12 @@ class BankingManager:
         self.store.reset()
 
 
+@lru_cache(maxsize=1)
 def default_data_path() -> str:
-    """Return the default path used for storing the application data."""
+    """Return the default path used for storing the application data.
+
+    The directory is created by :class:`BankingDataStore` when the store is
+    opened, so this function has no side effects.
+    """
 
-    base_dir = Path.home() / ".banking_app"
-    base_dir.mkdir(parents=True, exist_ok=True)
-    return str(base_dir / "data.json")
+    return str(Path.home() / ".banking_app" / "data.json")
@@ -2,41 +2,152 @@
 
 from __future__ import annotations
 
-import json
+import copy
 import os
+import tempfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+
+# Data file format: UTF-8 JSON, 2-space indent, keys in insertion order
+# (not sorted, so the order of stored records survives a round trip).
+# Either encoder can read the other's output. Float spelling may differ at
+# extreme magnitudes (``1e+16`` vs ``1e16``). NaN and Infinity are never
+# written: BankingManager rejects them, and the stdlib fallback refuses them
+# rather than emitting tokens orjson cannot parse.
+try:  # pragma: no cover - depends on the optional dependency being installed
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is missing
+    import json
+
+    loads_json = json.loads
+
+    def dumps_json(data: Dict[str, Any]) -> bytes:
+        """Serialise ``data`` as indented JSON bytes."""
+
+        return json.dumps(data, indent=2, ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+else:
+    loads_json = orjson.loads
+
+    def dumps_json(data: Dict[str, Any]) -> bytes:
+        """Serialise ``data`` as indented JSON bytes."""
+
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
 
 DEFAULT_DATA = {
-    "institutions": [],
-    "cards": [],
-    "credit_scores": [],
+    "institutions": {},
+    "cards": {},
+    "cards_by_institution": {},
+    "credit_scores": {},
 }
 
 
+def _migrate(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Upgrade data written by older versions to the indexed layout.
+
+    Institutions, cards and credit scores used to be stored as lists; they
+    are now keyed by lower-cased name, card id and lower-cased provider
+    respectively, with an index of card ids per lower-cased institution
+    name. Rows missing fields fall back to the same defaults as the models'
+    ``from_dict`` methods.
+    """
+
+    institutions = data.get("institutions", {})
+    if isinstance(institutions, list):
+        indexed: Dict[str, Any] = {}
+        for raw in institutions:
+            indexed.setdefault(str(raw.get("name", "")).lower(), raw)
+        data["institutions"] = indexed
+
+    credit_scores = data.get("credit_scores", {})
+    if isinstance(credit_scores, list):
+        indexed = {}
+        for raw in credit_scores:
+            indexed[str(raw.get("provider", "")).lower()] = raw
+        data["credit_scores"] = indexed
+
+    cards = data.get("cards", {})
+    if isinstance(cards, list):
+        indexed = {}
+        for raw in cards:
+            if raw.get("id") is None:
+                # Give id-less rows an id so they do not collide as "None".
+                from uuid import uuid4
+
+                raw["id"] = str(uuid4())
+            indexed[str(raw["id"])] = raw
+        data["cards"] = indexed
+
+    if "cards_by_institution" not in data:
+        by_institution: Dict[str, Any] = {}
+        for card_id, raw in data["cards"].items():
+            institution = str(raw.get("institution", "")).lower()
+            by_institution.setdefault(institution, []).append(card_id)
+        data["cards_by_institution"] = by_institution
+
+    for key, default in DEFAULT_DATA.items():
+        data.setdefault(key, type(default)())
+    return data
+
+
 class BankingDataStore:
     """Simple JSON file backed storage for the banking data."""
 
     def __init__(self, path: os.PathLike[str] | str) -> None:
         self.path = Path(path).expanduser()
+        self._cache: Optional[Dict[str, Any]] = None
+        self._stamp: Optional[Tuple[int, int]] = None
         self.path.parent.mkdir(parents=True, exist_ok=True)
         if not self.path.exists():
-            self.save(DEFAULT_DATA)
+            self.save(copy.deepcopy(DEFAULT_DATA))
 
     def load(self) -> Dict[str, Any]:
-        """Load the banking data from disk."""
+        """Load the banking data from disk.
+
+        The parsed data is cached and only re-read when the file's
+        modification time or size changes. The returned dict is shared with
+        the cache and must be treated as read-only; build modified copies and
+        pass them to :meth:`save` instead.
+        """
 
-        with self.path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        stamp = self._file_stamp()
+        if self._cache is None or stamp != self._stamp:
+            self._cache = _migrate(loads_json(self.path.read_bytes()))
+            self._stamp = stamp
+        return self._cache
 
     def save(self, data: Dict[str, Any]) -> None:
-        """Persist the given banking data to disk."""
+        """Persist the given banking data to disk.
+
+        The payload is written and fsynced to a temporary file which then
+        atomically replaces the data file, so a crash never leaves it half
+        written. The store keeps a reference to ``data`` as its cache, so the
+        caller must not mutate it afterwards.
+        """
+
+        payload = dumps_json(data) + b"\n"
+        # A unique temporary file per save, so concurrent writers never share one.
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._cache = data
+        self._stamp = self._file_stamp()
 
-        with self.path.open("w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2, sort_keys=True)
-            handle.write("\n")
+    def _file_stamp(self) -> Tuple[int, int]:
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
 
     def reset(self) -> None:
         """Reset the datastore to its default state."""
 
-        self.save(DEFAULT_DATA)
+        self.save(copy.deepcopy(DEFAULT_DATA))
@@ -0,0 +1,199 @@
+"""Tests for the command line interface."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from banking_app.cli import main
+
+
+def test_summary_outputs_json(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    storage = str(tmp_path / "data.json")
+    main(["--storage", storage, "add-institution", "Bänk A"])
+    main(
+        [
+            "--storage",
+            storage,
+            "add-card",
+            "Rewards",
+            "--institution",
+            "Bänk A",
+            "--card-type",
+            "credit",
+            "--credit-limit",
+            "1000",
+            "--balance",
+            "250",
+        ]
+    )
+    main(["--storage", storage, "update-credit-score", "Experian", "720"])
+    capsys.readouterr()
+
+    main(["--storage", storage, "summary"])
+    output = capsys.readouterr().out
+
+    summary = json.loads(output)
+    assert set(summary) == {
+        "total_institutions",
+        "total_cards",
+        "credit_utilisation",
+        "credit_scores",
+        "highest_credit_score",
+        "lowest_credit_score",
+        "average_credit_score",
+    }
+    assert summary["total_institutions"] == 1
+    assert summary["total_cards"] == 1
+    assert summary["credit_utilisation"] == 0.25
+    assert [score["provider"] for score in summary["credit_scores"]] == ["Experian"]
+    assert output.endswith("}\n")
+
+
+def test_summary_without_binary_stdout(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    stdout = io.StringIO()
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    main(["--storage", str(tmp_path / "data.json"), "summary"])
+
+    assert json.loads(stdout.getvalue())["total_cards"] == 0
+
+
+def test_list_commands_report_empty_store(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    storage = str(tmp_path / "data.json")
+
+    main(["--storage", storage, "list-institutions"])
+    main(["--storage", storage, "list-cards"])
+    main(["--storage", storage, "list-credit-scores"])
+
+    assert capsys.readouterr().out == (
+        "No institutions stored.\n"
+        "No cards stored.\n"
+        "No credit scores stored.\n"
+    )
+
+
+def test_list_institutions_output(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    storage = str(tmp_path / "data.json")
+    main(["--storage", storage, "add-institution", "Plain Bank"])
+    main(
+        [
+            "--storage",
+            storage,
+            "add-institution",
+            "Example Bank",
+            "--website",
+            "https://example.com",
+            "--support-phone",
+            "555-0100",
+            "--notes",
+            "Main account",
+        ]
+    )
+    capsys.readouterr()
+
+    main(["--storage", storage, "list-institutions"])
+
+    assert capsys.readouterr().out == (
+        "- Plain Bank\n"
+        "- Example Bank (https://example.com, 555-0100)\n"
+        "  Notes: Main account\n"
+    )
+
+
+def test_list_cards_output(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    storage = str(tmp_path / "data.json")
+    main(["--storage", storage, "add-institution", "Bank A"])
+    main(["--storage", storage, "add-institution", "Bank B"])
+    main(
+        [
+            "--storage",
+            storage,
+            "add-card",
+            "Basic",
+            "--institution",
+            "Bank A",
+            "--card-type",
+            "debit",
+        ]
+    )
+    main(
+        [
+            "--storage",
+            storage,
+            "add-card",
+            "Rewards Plus",
+            "--institution",
+            "Bank B",
+            "--card-type",
+            "credit",
+            "--credit-limit",
+            "5000",
+            "--balance",
+            "1200.5",
+            "--interest-rate",
+            "19.99",
+            "--annual-fee",
+            "95",
+            "--rewards",
+            "2% cashback",
+            "--tag",
+            "travel",
+            "--tag",
+            "personal",
+            "--notes",
+            "Pay in full",
+        ]
+    )
+    capsys.readouterr()
+
+    main(["--storage", storage, "list-cards"])
+    assert capsys.readouterr().out == (
+        "- Basic [debit] from Bank A\n"
+        "  Limit: 0.00 Balance: 0.00\n"
+        "- Rewards Plus [credit] from Bank B\n"
+        "  Limit: 5000.00 Balance: 1200.50 APR: 19.99% Annual fee: 95.00\n"
+        "  Rewards: 2% cashback\n"
+        "  Tags: travel, personal\n"
+        "  Notes: Pay in full\n"
+    )
+
+    main(["--storage", storage, "list-cards", "--institution", "bank a"])
+    assert capsys.readouterr().out == (
+        "- Basic [debit] from Bank A\n"
+        "  Limit: 0.00 Balance: 0.00\n"
+    )
+
+
+def test_list_credit_scores_output(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    storage = str(tmp_path / "data.json")
+    main(["--storage", storage, "update-credit-score", "Experian", "720", "--date", "2023-05-01"])
+    main(
+        [
+            "--storage",
+            storage,
+            "update-credit-score",
+            "Equifax",
+            "705",
+            "--date",
+            "2023-06-01T08:30:00+00:00",
+            "--notes",
+            "Dropped after new card",
+        ]
+    )
+    capsys.readouterr()
+
+    main(["--storage", storage, "list-credit-scores"])
+
+    assert capsys.readouterr().out == (
+        "- Experian: 720 (updated 2023-05-01)\n"
+        "- Equifax: 705 (updated 2023-06-01)\n"
+        "  Notes: Dropped after new card\n"
+    )
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import json
 from datetime import UTC, datetime
 from pathlib import Path
 
+import pytest
+
+from banking_app import storage
 from banking_app.models import Institution
 from banking_app.services import BankingManager
 from banking_app.storage import BankingDataStore
@@ -107,3 +111,144 @@ def test_summary_report(tmp_path: Path) -> None:
 
     credit_score_providers = {item["provider"] for item in summary["credit_scores"]}
     assert credit_score_providers == {"Experian", "Equifax"}
+
+
+def test_store_reloads_after_external_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "data.json"
+    store = BankingDataStore(path)
+    manager = BankingManager(store)
+    manager.add_institution(Institution(name="Bank A"))
+
+    # An unchanged file is served from the cache without re-parsing.
+    parses = []
+    real_loads = storage.loads_json
+    monkeypatch.setattr(storage, "loads_json", lambda raw: parses.append(raw) or real_loads(raw))
+    snapshot = store.load()
+    assert store.load() is snapshot
+    assert parses == []
+
+    # Mutations go through copies, leaving earlier snapshots untouched.
+    manager.add_card(
+        institution_name="Bank A", name="A1", card_type="credit", credit_limit=100
+    )
+    assert snapshot["cards"] == {}
+    assert len(manager.list_cards("Bank A")) == 1
+    assert parses == []
+
+    # Writes made through another store instance are picked up.
+    other = BankingManager(BankingDataStore(path))
+    other.add_institution(Institution(name="Bank B"))
+    assert {inst.name for inst in manager.list_institutions()} == {"Bank A", "Bank B"}
+
+
+def test_legacy_list_layout_is_migrated(tmp_path: Path) -> None:
+    path = tmp_path / "data.json"
+    path.write_text(
+        json.dumps(
+            {
+                "institutions": [{"name": "Bank A"}, {"name": "Bank B"}, {"website": "x"}],
+                "cards": [
+                    {"id": "1", "institution": "Bank A", "name": "A1", "card_type": "credit", "credit_limit": 100.0},
+                    {"id": "2", "institution": "Bank B", "name": "B1", "card_type": "debit", "credit_limit": 0.0},
+                    {"name": "Orphan"},
+                    {"name": "Orphan 2"},
+                ],
+                "credit_scores": [
+                    {"provider": "Experian", "score": 700, "last_updated": "2023-05-01T12:00:00+00:00"},
+                    {"score": 650},
+                    {"provider": "TransUnion"},
+                ],
+            }
+        )
+    )
+    manager = BankingManager(BankingDataStore(path))
+
+    assert [inst.name for inst in manager.list_institutions()] == ["Bank A", "Bank B", ""]
+    assert [card.id for card in manager.list_cards("bank b")] == ["2"]
+
+    # Rows missing their id get distinct generated ids instead of colliding.
+    cards = manager.list_cards()
+    assert len({card.id for card in cards}) == 4
+    assert {card.name for card in cards if card.institution == ""} == {"Orphan", "Orphan 2"}
+
+    # A score row without a score counts as 0, as CreditScore.from_dict does.
+    summary = manager.summary()
+    assert summary["lowest_credit_score"] == 0
+    assert summary["credit_utilisation"] == 0.0
+
+    manager.update_credit_score(provider="experian", score=710)
+    scores = manager.list_credit_scores()
+    assert [(score.provider, score.score) for score in scores] == [
+        ("experian", 710),
+        ("", 650),
+        ("TransUnion", 0),
+    ]
+
+    with pytest.raises(ValueError):
+        manager.add_institution(Institution(name="BANK A"))
+
+
+def test_summary_without_limits_or_scores(tmp_path: Path) -> None:
+    manager = BankingManager(BankingDataStore(tmp_path / "data.json"))
+    manager.add_institution(Institution(name="Bank A"))
+    manager.add_card(
+        institution_name="Bank A", name="Debit", card_type="debit", credit_limit=0
+    )
+
+    summary = manager.summary()
+    assert summary["credit_utilisation"] == 0.0
+    assert summary["average_credit_score"] is None
+
+    manager.update_credit_score(provider="Experian", score=700)
+    manager.update_credit_score(provider="Equifax", score=701)
+    assert manager.summary()["average_credit_score"] == 700.5
+
+
+def test_failed_save_keeps_data_file_and_removes_temp_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "data.json"
+    manager = BankingManager(BankingDataStore(path))
+    manager.add_institution(Institution(name="Bank A"))
+    before = path.read_bytes()
+
+    def failing_replace(src: object, dst: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("banking_app.storage.os.replace", failing_replace)
+    with pytest.raises(OSError):
+        manager.add_institution(Institution(name="Bank B"))
+
+    assert path.read_bytes() == before
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+@pytest.mark.parametrize(
+    "field_name", ["credit_limit", "balance", "interest_rate", "annual_fee"]
+)
+@pytest.mark.parametrize("value", [float("inf"), float("-inf"), float("nan")])
+def test_add_card_rejects_non_finite_amounts(
+    tmp_path: Path, field_name: str, value: float
+) -> None:
+    manager = BankingManager(BankingDataStore(tmp_path / "data.json"))
+    manager.add_institution(Institution(name="Bank A"))
+    kwargs = {"credit_limit": 1000.0, field_name: value}
+
+    with pytest.raises(ValueError, match=field_name):
+        manager.add_card(institution_name="Bank A", name="X", card_type="credit", **kwargs)
+
+    assert manager.list_cards() == []
+
+
+def test_update_credit_score_rejects_out_of_range_scores(tmp_path: Path) -> None:
+    manager = BankingManager(BankingDataStore(tmp_path / "data.json"))
+
+    with pytest.raises(ValueError, match="out of range"):
+        manager.update_credit_score(provider="Big", score=99999999999999999999999)
+    with pytest.raises(ValueError, match="out of range"):
+        manager.update_credit_score(provider="Small", score=-(2**63) - 1)
+
+    manager.update_credit_score(provider="Max", score=2**63 - 1)
+    assert manager.list_credit_scores()[0].score == 2**63 - 1
@@ -0,0 +1,74 @@
+"""Tests for the JSON storage helpers."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from banking_app import storage
+
+SAMPLE = {
+    "institutions": {"bänk a": {"name": "Bänk A", "website": None}},
+    "cards": {
+        "1": {
+            "id": "1",
+            "credit_limit": 5000.0,
+            "interest_rate": 19.99,
+            "tags": ["personal", "cashback"],
+        }
+    },
+    "cards_by_institution": {"bänk a": ["1"]},
+    "credit_scores": {},
+}
+
+
+@pytest.fixture
+def fallback_storage(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Load a private copy of the storage module as if orjson were missing."""
+
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.spec_from_file_location(
+        "banking_app._storage_without_orjson", Path(storage.__file__)
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert not hasattr(module, "orjson")
+    return module
+
+
+def test_fallback_encoder_matches_default(fallback_storage: ModuleType) -> None:
+    payload = fallback_storage.dumps_json(SAMPLE)
+
+    assert payload == storage.dumps_json(SAMPLE)
+    assert storage.loads_json(payload) == SAMPLE
+    assert fallback_storage.loads_json(storage.dumps_json(SAMPLE)) == SAMPLE
+
+
+def test_fallback_encoder_rejects_non_finite_floats(fallback_storage: ModuleType) -> None:
+    with pytest.raises(ValueError):
+        fallback_storage.dumps_json({"balance": float("nan")})
+
+
+def test_each_save_uses_its_own_temp_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = storage.BankingDataStore(tmp_path / "data.json")
+    replaced = []
+    real_replace = storage.os.replace
+
+    def recording_replace(src: str, dst: Path) -> None:
+        replaced.append(Path(src))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(storage.os, "replace", recording_replace)
+    store.save(SAMPLE)
+    store.save(SAMPLE)
+
+    assert len(set(replaced)) == 2
+    assert all(path.parent == tmp_path and path.name.startswith("data.json") for path in replaced)
+    assert list(tmp_path.glob("*.tmp")) == []
+    assert storage.loads_json((tmp_path / "data.json").read_bytes()) == SAMPLE